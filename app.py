@@ -2,38 +2,77 @@ from __future__ import annotations
 
 import json
 import math
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from itertools import islice, zip_longest
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from flask import Flask, jsonify, render_template, request
+import numpy as np
+from flask import Flask, Response, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
 
-from bondcalc.analytics import calculate_accrued_interest, compute_periods
+from bondcalc.analytics import calculate_accrued_interest, compute_periods, parse_ddmmyyyy
 from bondcalc.plotting import (
-    calculate_convexity_curve,
-    calculate_modified_duration_curve,
-    calculate_price_yield_derivative,
-    generate_price_yield_curve,
+    curve_metrics_arrays,
+    generate_price_yield_curve_arrays,
+    generate_yield_price_curve_arrays,
+    price_yield_points,
 )
-from bondcalc.pricing import bond_price, calculate_ytm
+from bondcalc.pricing import calculate_ytm
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _json_safe(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+class NumpyJSONProvider(DefaultJSONProvider):
+    # Emit NaN/inf as null, matching orjson, since the standard library would
+    # write bare NaN tokens that browsers' JSON.parse rejects.
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return super().dumps(_json_safe(obj), **kwargs)
+
 
 app = Flask(__name__)
+app.json = NumpyJSONProvider(app)
 
 
 DATA_PATH = Path(__file__).resolve().parent / "data" / "bonds.json"
 
 
+@lru_cache(maxsize=8)
+def _load_bonds_cached(mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    with DATA_PATH.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
 def load_bonds() -> Dict[str, Dict[str, Any]]:
+    # Keyed on the file's mtime so edits to bonds.json are picked up
+    # without re-reading it on every page load.
     if not DATA_PATH.exists():
         return {}
-    with DATA_PATH.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _load_bonds_cached(DATA_PATH.stat().st_mtime_ns)
 
 
-def _parse_date(value: str) -> Optional[datetime.date]:
+def _parse_date(value: str) -> Optional[date]:
     try:
-        return datetime.strptime(value, "%d/%m/%Y").date()
-    except (ValueError, TypeError):
+        return parse_ddmmyyyy(value)
+    except (ValueError, TypeError, AttributeError):
         return None
 
 
@@ -45,26 +84,21 @@ def _coerce_number(value: Any, cast=float) -> Optional[Any]:
 
 
 def _generate_yield_targets(ytm: float, max_points: int = 8) -> list[int]:
-    if ytm is None or not math.isfinite(ytm):
+    if ytm is None or not math.isfinite(ytm) or max_points <= 0:
         return []
 
-    targets = {0}
-    rounded_ytm = int(round(ytm))
-    is_integer_ytm = float(ytm).is_integer()
-    lower = math.floor(ytm)
-    upper = math.ceil(ytm)
-
-    while len(targets) < max_points:
-        if lower >= 0 and not (is_integer_ytm and lower == rounded_ytm):
-            targets.add(lower)
-        if len(targets) >= max_points:
-            break
-        if upper >= 0 and not (is_integer_ytm and upper == rounded_ytm):
-            targets.add(upper)
-        lower -= 1
-        upper += 1
-
-    return sorted(targets)[:max_points]
+    # Always include 0%, then alternate outward from the current yield: the
+    # integers below it (down to 1) and above it, skipping the yield itself
+    # when it is already an integer.
+    if float(ytm).is_integer():
+        lower, upper = int(ytm) - 1, int(ytm) + 1
+    else:
+        lower, upper = math.floor(ytm), math.ceil(ytm)
+    upper = max(upper, 1)
+    below = range(lower, 0, -1)
+    above = range(upper, upper + max_points)
+    interleaved = (target for pair in zip_longest(below, above) for target in pair if target is not None)
+    return sorted([0, *islice(interleaved, max_points - 1)])
 
 
 def _build_price_change_profile(
@@ -91,20 +125,10 @@ def _build_price_change_profile(
     if not yield_targets:
         return {"ytm": [], "price_change_pct": []}
 
-    deltas = []
-    for target in yield_targets:
-        price_at_yield = bond_price(
-            par_value,
-            coupon_rate,
-            periods,
-            target / 100,
-            coupon_frequency,
-        )
-        if not math.isfinite(price_at_yield) or not math.isfinite(current_price):
-            deltas.append(math.nan)
-            continue
-        deltas.append(((price_at_yield - current_price) / current_price) * 100)
-
+    prices = price_yield_points(par_value, coupon_rate, periods, coupon_frequency, yield_targets)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        deltas = (prices - current_price) / current_price * 100
+    deltas = np.where(np.isfinite(deltas), deltas, np.nan)
     return {"ytm": yield_targets, "price_change_pct": deltas}
 
 
@@ -138,18 +162,31 @@ def _build_analysis(payload: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]],
     if periods <= 0:
         return None, "The purchase date must be before the maturity date."
 
-    curve = generate_price_yield_curve(
-        par_value,
-        coupon_rate,
-        periods,
-        coupon_frequency,
-        min_price,
-        max_price,
-        num_points=num_points,
-    )
-    derivative = calculate_price_yield_derivative(curve)
-    modified_duration = calculate_modified_duration_curve(curve)
-    convexity = calculate_convexity_curve(curve)
+    # Yield is the plotted axis, so solve only the two endpoint yields and
+    # price a uniform yield grid forward between them.
+    min_ytm = calculate_ytm(max_price, par_value, coupon_rate, periods, coupon_frequency)
+    max_ytm = calculate_ytm(min_price, par_value, coupon_rate, periods, coupon_frequency)
+    if math.isfinite(min_ytm) and math.isfinite(max_ytm):
+        curve_ytms, curve_prices = generate_yield_price_curve_arrays(
+            par_value,
+            coupon_rate,
+            periods,
+            coupon_frequency,
+            min_ytm,
+            max_ytm,
+            num_points=num_points,
+        )
+    else:
+        curve_ytms, curve_prices = generate_price_yield_curve_arrays(
+            par_value,
+            coupon_rate,
+            periods,
+            coupon_frequency,
+            min_price,
+            max_price,
+            num_points=num_points,
+        )
+    metrics = curve_metrics_arrays(curve_ytms, curve_prices)
 
     accrued_interest = calculate_accrued_interest(
         par_value,
@@ -186,10 +223,10 @@ def _build_analysis(payload: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]],
 
     response = {
         "summary": summary,
-        "curve": curve.to_dict(orient="list"),
-        "derivative": derivative.to_dict(orient="list"),
-        "modified_duration": modified_duration.to_dict(orient="list"),
-        "convexity": convexity.to_dict(orient="list"),
+        "curve": {"ytm": curve_ytms, "price": curve_prices},
+        "derivative": {"ytm": metrics["ytm"], "price_derivative": metrics["price_derivative"]},
+        "modified_duration": {"ytm": metrics["ytm"], "modified_duration": metrics["modified_duration"]},
+        "convexity": {"ytm": metrics["ytm"], "convexity": metrics["convexity"]},
         "price_change": price_change,
     }
     return response, None
@@ -207,6 +244,9 @@ def analyze():
     data, error = _build_analysis(payload)
     if error:
         return jsonify({"error": error}), 400
+    if orjson is not None:
+        body = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        return Response(body, mimetype="application/json")
     return jsonify(data)
 
 
@@ -4,19 +4,28 @@ from .models import Bond, AnalysisRequest, AnalysisResult
 from .pricing import bond_price, calculate_ytm
 from .analytics import (
     calculate_accrued_interest,
+    calculate_accrued_interest_batch,
     calculate_modified_duration,
     calculate_ytm_from_bond_data,
     compute_periods,
     generate_cash_flows,
+    parse_ddmmyyyy,
 )
 from .plotting import (
     calculate_convexity_curve,
     calculate_modified_duration_curve,
     calculate_price_yield_derivative,
     calculate_ytm_range,
+    compute_all_curves,
+    curve_metrics_arrays,
     generate_price_yield_curve,
+    generate_price_yield_curve_arrays,
+    generate_yield_price_curve,
+    generate_yield_price_curve_arrays,
+    get_reusable_ax,
     plot_price_yield_curve,
     plot_price_yield_derivative,
+    price_yield_points,
 )
 
 __all__ = [
@@ -26,15 +35,24 @@ __all__ = [
     "bond_price",
     "calculate_ytm",
     "calculate_accrued_interest",
+    "calculate_accrued_interest_batch",
     "calculate_modified_duration",
     "calculate_ytm_from_bond_data",
     "compute_periods",
     "generate_cash_flows",
+    "parse_ddmmyyyy",
     "calculate_ytm_range",
     "generate_price_yield_curve",
+    "generate_yield_price_curve",
     "plot_price_yield_curve",
     "calculate_price_yield_derivative",
     "calculate_modified_duration_curve",
     "calculate_convexity_curve",
+    "compute_all_curves",
+    "curve_metrics_arrays",
+    "generate_price_yield_curve_arrays",
+    "generate_yield_price_curve_arrays",
+    "price_yield_points",
     "plot_price_yield_derivative",
+    "get_reusable_ax",
 ]
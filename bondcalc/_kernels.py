@@ -0,0 +1,101 @@
+"""Numeric kernels shared by the pricing and curve code.
+
+numba is an optional accelerator: when it is installed the scalar kernels are
+compiled to native code, otherwise they run as plain Python functions.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _bond_price_kernel(par_value, coupon_rate, periods, ytm, coupon_frequency):
+    coupon = (coupon_rate / 100) * par_value / coupon_frequency
+
+    # Handle the zero-yield edge case to avoid dividing by zero while
+    # preserving the limit price where discounting disappears.
+    if abs(ytm) < 1e-12:
+        return coupon * periods + par_value
+
+    discount_factor = 1 / (1 + ytm / coupon_frequency)
+    discount_n = discount_factor ** periods
+    coupon_pv = coupon * (1 - discount_n) / (ytm / coupon_frequency)
+    par_pv = par_value * discount_n
+    return coupon_pv + par_pv
+
+
+@njit(cache=True)
+def _bond_price_and_derivative_kernel(par_value, coupon_rate, periods, ytm, coupon_frequency):
+    # Price and dP/dy together, sharing a single power of the discount factor.
+    coupon = (coupon_rate / 100) * par_value / coupon_frequency
+    if abs(ytm) < 1e-12:
+        d_rate = -(coupon * periods * (periods + 1) / 2 + periods * par_value)
+        return coupon * periods + par_value, d_rate / coupon_frequency
+
+    rate = ytm / coupon_frequency
+    discount_factor = 1 / (1 + rate)
+    discount_n = discount_factor ** periods
+    discount_n1 = discount_n * discount_factor
+    price = coupon * (1 - discount_n) / rate + par_value * discount_n
+    d_rate = coupon * (periods * discount_n1 / rate - (1 - discount_n) / rate ** 2) - periods * par_value * discount_n1
+    return price, d_rate / coupon_frequency
+
+
+@njit(cache=True)
+def _ytm_newton_kernel(price, par_value, coupon_rate, periods, coupon_frequency, guess, maxiter, tol):
+    # Newton iteration on the price error using the closed-form dP/dy.
+    # Returns NaN when the step stalls, leaves the domain of the price
+    # function (1 + y/f <= 0) or the solve does not converge.
+    ytm = guess
+    for _ in range(maxiter):
+        if 1 + ytm / coupon_frequency <= 0:
+            return math.nan
+        model_price, derivative = _bond_price_and_derivative_kernel(par_value, coupon_rate, periods, ytm, coupon_frequency)
+        if derivative == 0 or math.isnan(derivative):
+            return math.nan
+        step = (model_price - price) / derivative
+        ytm -= step
+        if abs(step) < tol:
+            return ytm
+    return math.nan
+
+
+def _bond_price_vec(par_value, coupon_rate, periods, ytm, coupon_frequency):
+    rate = ytm / coupon_frequency
+    coupon = (coupon_rate / 100) * par_value / coupon_frequency
+    zero_rate = np.abs(rate) < 1e-12
+    safe_rate = np.where(zero_rate, 1.0, rate)
+    discount = (1 + safe_rate) ** -periods
+    price = coupon * (1 - discount) / safe_rate + par_value * discount
+    return np.where(zero_rate, coupon * periods + par_value, price)
+
+
+def _bond_price_and_derivative_vec(par_value, coupon_rate, periods, ytm, coupon_frequency):
+    rate = ytm / coupon_frequency
+    coupon = (coupon_rate / 100) * par_value / coupon_frequency
+    zero_rate = np.abs(rate) < 1e-12
+    safe_rate = np.where(zero_rate, 1.0, rate)
+    discount_factor = 1 / (1 + safe_rate)
+    discount = discount_factor ** periods
+    discount_next = discount * discount_factor
+    price = coupon * (1 - discount) / safe_rate + par_value * discount
+    d_rate = (
+        coupon * (periods * discount_next / safe_rate - (1 - discount) / safe_rate ** 2)
+        - periods * par_value * discount_next
+    )
+    d_rate_zero = -coupon * periods * (periods + 1) / 2 - periods * par_value
+    return (
+        np.where(zero_rate, coupon * periods + par_value, price),
+        np.where(zero_rate, d_rate_zero, d_rate) / coupon_frequency,
+    )
@@ -1,34 +1,52 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import List
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List
 
 import math
 
+import numpy as np
+
 from .models import AnalysisRequest, AnalysisResult, Bond
 from .pricing import bond_price, calculate_ytm
 
 
-def compute_periods(maturity_date: datetime.date, purchase_date: datetime.date, coupon_frequency: int) -> int:
+_DDMMYYYY_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+
+@lru_cache(maxsize=1024)
+def parse_ddmmyyyy(date_str: str) -> date:
+    # Same inputs as strptime(date_str, "%d/%m/%Y"): four-digit years only,
+    # no padding or signs.
+    match = _DDMMYYYY_RE.fullmatch(date_str)
+    if match is None:
+        raise ValueError(f"date {date_str!r} does not match format DD/MM/YYYY")
+    day, month, year = match.groups()
+    return date(int(year), int(month), int(day))
+
+
+def compute_periods(maturity_date: date, purchase_date: date, coupon_frequency: int) -> int:
     delta = maturity_date - purchase_date
     return round(delta.days / 365.25 * coupon_frequency)
 
 
-def calculate_accrued_interest(par_value: float, coupon_rate: float, issue_date: str, purchase_date: str, coupon_frequency: int = 1):
+def calculate_accrued_interest(par_value: float, coupon_rate: float, issue_date: str, purchase_date: str, coupon_frequency: int = 1) -> float:
     try:
         par_value = float(par_value)
         coupon_rate = float(coupon_rate)
-        issue = datetime.strptime(issue_date, "%d/%m/%Y")
-        purchase = datetime.strptime(purchase_date, "%d/%m/%Y")
+        issue = parse_ddmmyyyy(issue_date)
+        purchase = parse_ddmmyyyy(purchase_date)
         coupon_interval = 365.25 / coupon_frequency
-        years_since_issue = (purchase - issue).days / 365.25
-        coupons_paid = int(years_since_issue * coupon_frequency)
-        last_coupon_date = issue
-        for _ in range(coupons_paid):
-            increment = timedelta(days=coupon_interval)
-            last_coupon_date += increment
-
-        days_since_last_coupon = (purchase - last_coupon_date).days
+        days_since_issue = (purchase - issue).days
+        # A purchase before issue has no coupons behind it; keep the last
+        # coupon at the issue date rather than stepping backwards.
+        coupons_paid = max(int(days_since_issue / 365.25 * coupon_frequency), 0)
+
+        # The last coupon falls coupons_paid intervals after issue; count the
+        # whole days elapsed since then.
+        days_since_last_coupon: float = math.floor(days_since_issue - coupons_paid * coupon_interval)
         if days_since_last_coupon < 0:
             days_since_last_coupon += coupon_interval
 
@@ -39,29 +57,122 @@ def calculate_accrued_interest(par_value: float, coupon_rate: float, issue_date:
         return math.nan
 
 
-def calculate_modified_duration(par_value: float, coupon_rate: float, periods: int, ytm: float, coupon_frequency: int = 1):
+def _to_datetime64(value: Any) -> np.datetime64:
+    try:
+        if isinstance(value, str):
+            value = parse_ddmmyyyy(value)
+        return np.datetime64(value, "D")
+    except (ValueError, TypeError):
+        return np.datetime64("NaT")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def _as_day_array(values: Any) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[D]")
+    days = [_to_datetime64(value) for value in values.ravel().tolist()]
+    return np.array(days, dtype="datetime64[D]").reshape(values.shape)
+
+
+def _as_float_array(values: Any) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        values = np.asarray(values, dtype=object)
+        return np.array([_to_float(value) for value in values.ravel()], dtype=np.float64).reshape(values.shape)
+
+
+def calculate_accrued_interest_batch(par_values: Any, coupon_rates: Any, issue_dates: Any, purchase_dates: Any, coupon_frequency: Any = 1) -> np.ndarray:
+    # Portfolio version of calculate_accrued_interest. Dates may be DD/MM/YYYY
+    # strings (as for the scalar function), date objects or datetime64 values,
+    # and every argument broadcasts. Lanes with an unparsable date or a
+    # non-numeric input come back as NaN instead of raising.
+    issue = _as_day_array(issue_dates)
+    purchase = _as_day_array(purchase_dates)
+    par_values = _as_float_array(par_values)
+    coupon_rates = _as_float_array(coupon_rates)
+    coupon_frequency = _as_float_array(coupon_frequency)
+
+    missing = np.isnat(issue) | np.isnat(purchase)
+    days_since_issue = np.where(missing, 0, (purchase - issue).astype(np.int64)).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        coupon_interval = 365.25 / coupon_frequency
+        coupons_paid = np.maximum(np.trunc(days_since_issue / 365.25 * coupon_frequency), 0)
+        days_since_last_coupon = np.floor(days_since_issue - coupons_paid * coupon_interval)
+        days_since_last_coupon = np.where(
+            days_since_last_coupon < 0, days_since_last_coupon + coupon_interval, days_since_last_coupon
+        )
+        annual_coupon = (coupon_rates / 100) * par_values
+        accrued_interest = annual_coupon * (days_since_last_coupon / coupon_interval)
+    return np.where(missing | ~np.isfinite(accrued_interest), np.nan, accrued_interest)
+
+
+@lru_cache(maxsize=64)
+def _t_array(periods: int) -> np.ndarray:
+    t = np.arange(1, periods + 1, dtype=np.float64)
+    t.flags.writeable = False
+    return t
+
+
+def _macaulay_duration_sum(coupon: float, par_value: float, periods: int, discount_rate: float) -> float:
+    t = _t_array(periods)
+    cash_flows = np.full(periods, coupon)
+    cash_flows[-1] += par_value
+    # Discount factors as a running product of 1 / (1 + r) rather than a
+    # separate power per period.
+    discount_factors = np.cumprod(np.full(periods, 1.0 / (1.0 + discount_rate)))
+    pv_cash_flows = cash_flows * discount_factors
+    present_value_total = pv_cash_flows.sum()
+    if present_value_total == 0:
+        return math.nan
+    return float((t * pv_cash_flows).sum() / present_value_total)
+
+
+def _macaulay_duration_closed_form(coupon: float, par_value: float, periods: int, discount_rate: float) -> float:
+    # With v = 1 / (1 + r): PV = c * (1 - v^n) / r + F * v^n and
+    # sum(t * v^t) = (1 + r) / r^2 * (1 - v^n - n * v^n * r / (1 + r)).
+    # expm1/log1p keep 1 - v^n accurate when r is small.
+    log_discount = -periods * math.log1p(discount_rate)
+    discount_n = math.exp(log_discount)
+    annuity_factor = -math.expm1(log_discount)
+    present_value_total = coupon * annuity_factor / discount_rate + par_value * discount_n
+    if present_value_total == 0:
+        return math.nan
+
+    weighted_periods = (1 + discount_rate) / discount_rate ** 2 * (
+        annuity_factor - periods * discount_n * discount_rate / (1 + discount_rate)
+    )
+    return (coupon * weighted_periods + periods * par_value * discount_n) / present_value_total
+
+
+def calculate_modified_duration(par_value: float, coupon_rate: float, periods: int, ytm: float, coupon_frequency: int = 1) -> float:
     try:
         par_value = float(par_value)
         coupon_rate = float(coupon_rate)
         ytm = float(ytm)
         coupon = (coupon_rate / 100) * par_value / coupon_frequency
         discount_rate = ytm / coupon_frequency
-        macaulay_duration = 0
-        present_value_total = 0
-
-        for t in range(1, int(periods) + 1):
-            cash_flow = coupon if t < periods else coupon + par_value
-            pv_cash_flow = cash_flow / (1 + discount_rate) ** t
-            macaulay_duration += t * pv_cash_flow
-            present_value_total += pv_cash_flow
-
-        if present_value_total == 0:
+        periods = int(periods)
+        if periods <= 0:
             return math.nan
 
-        macaulay_duration /= present_value_total
+        # The closed form loses precision as r -> 0, so near-zero rates sum
+        # the discounted cash flows instead.
+        if abs(discount_rate) < 1e-6:
+            macaulay_duration = _macaulay_duration_sum(coupon, par_value, periods, discount_rate)
+        else:
+            macaulay_duration = _macaulay_duration_closed_form(coupon, par_value, periods, discount_rate)
+
         modified_duration = macaulay_duration / (1 + discount_rate)
         return modified_duration
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return math.nan
 
 
@@ -82,10 +193,10 @@ def calculate_ytm_from_bond_data(
     issue_price: float | None = None,
     min_price: float | None = None,
     max_price: float | None = None,
-):
+) -> Dict[str, Any] | None:
     try:
-        purchase = datetime.strptime(purchase_date, "%d/%m/%Y")
-        maturity = datetime.strptime(maturity_date, "%d/%m/%Y")
+        purchase = parse_ddmmyyyy(purchase_date)
+        maturity = parse_ddmmyyyy(maturity_date)
         if maturity <= purchase:
             return None
         periods = compute_periods(maturity, purchase, coupon_frequency)
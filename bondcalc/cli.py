@@ -3,11 +3,10 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, Tuple
 
-from .analytics import calculate_ytm_from_bond_data, compute_periods
+from .analytics import calculate_ytm_from_bond_data, compute_periods, parse_ddmmyyyy
 from .models import AnalysisRequest, AnalysisResult, Bond
 from .plotting import plot_price_yield_curve, plot_price_yield_derivative
 
@@ -15,7 +14,7 @@ DATE_FORMAT = "%d/%m/%Y"
 
 
 def _parse_date(date_str: str):
-    return datetime.strptime(date_str, DATE_FORMAT).date()
+    return parse_ddmmyyyy(date_str)
 
 
 def load_bonds(path: Path) -> Dict[str, Bond]:
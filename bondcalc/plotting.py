@@ -1,24 +1,74 @@
 from __future__ import annotations
 
 import math
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
-from .pricing import calculate_ytm
+import numpy as np
 
+from ._kernels import _bond_price_and_derivative_vec, _bond_price_vec
+from .pricing import _approximate_ytm, calculate_ytm
 
-def calculate_ytm_range(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100) -> Tuple[list, list]:
+
+def _calculate_ytm_range_arrays(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
     try:
-        step = (max_price - min_price) / (num_points - 1)
-        prices = [min_price + i * step for i in range(num_points)]
-        ytms = []
-        for price in prices:
-            ytm = calculate_ytm(price, par_value, coupon_rate, periods, coupon_frequency)
-            ytms.append(ytm if not math.isnan(ytm) else math.nan)
+        par_value = float(par_value)
+        coupon_rate = float(coupon_rate)
+        if num_points < 1:
+            return np.empty(0), np.empty(0)
+        prices = np.linspace(min_price, max_price, num_points)
+        # Same input checks as calculate_ytm: no valid yield without periods.
+        if math.isnan(periods) or periods <= 0:
+            return prices, np.full(num_points, np.nan)
+
+        # Converged lanes are frozen and the loop stops once none are left.
+        converged = np.zeros(num_points, dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            # Seed every lane with the textbook YTM approximation, then run a
+            # batched Newton solve using the closed-form price derivative.
+            ytms = _approximate_ytm(prices, par_value, coupon_rate, periods, coupon_frequency)
+            for _ in range(30):
+                active = ~converged & np.isfinite(ytms)
+                if not active.any():
+                    break
+                ytm_active = ytms[active]
+                model_prices, derivatives = _bond_price_and_derivative_vec(
+                    par_value, coupon_rate, periods, ytm_active, coupon_frequency
+                )
+                step = (model_prices - prices[active]) / derivatives
+                ytms[active] = ytm_active - step
+                converged[active] = np.abs(step) < 1e-10
+        converged &= np.isfinite(ytms)
+        ytms = np.where(converged, ytms * 100, np.nan)
+
+        # Lanes that did not settle fall back to the scalar solver, fed plain
+        # floats since NumPy scalars slow down its arithmetic. Prices are
+        # monotone in yield, so the previous lane's root (solved by either
+        # path) is a close warm start.
+        solve_ytm = calculate_ytm
+        unsettled = np.flatnonzero(~converged)
+        for idx, price in zip(unsettled.tolist(), prices[unsettled].tolist()):
+            guess = float(ytms[idx - 1]) / 100 if idx > 0 else None
+            ytms[idx] = solve_ytm(price, par_value, coupon_rate, periods, coupon_frequency, guess)
         return prices, ytms
     except Exception:
         return None, None
 
 
+def calculate_ytm_range(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100) -> Tuple[Optional[list], Optional[list]]:
+    prices, ytms = _calculate_ytm_range_arrays(
+        par_value,
+        coupon_rate,
+        periods,
+        coupon_frequency,
+        min_price,
+        max_price,
+        num_points,
+    )
+    if prices is None or ytms is None:
+        return None, None
+    return prices.tolist(), ytms.tolist()
+
+
 def _ensure_pandas():
     try:
         import pandas as pd
@@ -28,24 +78,30 @@ def _ensure_pandas():
         raise RuntimeError("pandas is required for curve generation") from exc
 
 
+def _ensure_matplotlib():
+    try:
+        import matplotlib.pyplot as plt
+
+        return plt
+    except ImportError as exc:
+        raise RuntimeError("matplotlib is required for plotting") from exc
+
+
 def _compute_first_derivative(xs, ys):
-    derivatives = []
-    for idx in range(len(xs)):
-        if idx == 0:
-            delta_x = xs[1] - xs[0]
-            delta_y = ys[1] - ys[0]
-        elif idx == len(xs) - 1:
-            delta_x = xs[-1] - xs[-2]
-            delta_y = ys[-1] - ys[-2]
-        else:
-            delta_x = xs[idx + 1] - xs[idx - 1]
-            delta_y = ys[idx + 1] - ys[idx - 1]
-
-        if delta_x == 0 or any(math.isnan(val) for val in (delta_x, delta_y)):
-            derivatives.append(math.nan)
-        else:
-            derivatives.append(delta_y / delta_x)
-    return derivatives
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        derivatives = np.gradient(ys, xs)
+    return np.where(np.isfinite(derivatives), derivatives, np.nan)
+
+
+def _clean_curve_arrays(ytms, prices):
+    ytms = np.asarray(ytms, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    finite = np.isfinite(ytms) & np.isfinite(prices)
+    # np.unique sorts by yield and keeps the first price seen for each one.
+    ytms, first_index = np.unique(ytms[finite], return_index=True)
+    return ytms, prices[finite][first_index]
 
 
 def _prepare_clean_curve(curve, columns):
@@ -53,76 +109,86 @@ def _prepare_clean_curve(curve, columns):
     if curve is None or getattr(curve, "empty", True):
         return pd.DataFrame(columns=columns)
 
-    cleaned_curve = (
-        curve[["ytm", "price"]]
-        .replace([math.inf, -math.inf], math.nan)
-        .dropna()
-        .sort_values("ytm")
-        .drop_duplicates(subset="ytm")
+    ytms, prices = _clean_curve_arrays(
+        curve["ytm"].to_numpy(dtype=np.float64),
+        curve["price"].to_numpy(dtype=np.float64),
     )
-    if cleaned_curve.empty or len(cleaned_curve.index) < 2:
+    if len(ytms) < 2:
         return pd.DataFrame(columns=columns)
-    return cleaned_curve.reset_index(drop=True)
+    return _curve_frame(ytms, prices)
 
 
-def calculate_price_yield_derivative(curve):
-    pd = _ensure_pandas()
-    cleaned_curve = _prepare_clean_curve(curve, ["ytm", "price_derivative"])
-    if cleaned_curve.empty:
-        return cleaned_curve
-
-    ytms = list(cleaned_curve["ytm"].tolist())
-    prices = list(cleaned_curve["price"].tolist())
-    ytms_decimal = [ytm / 100 for ytm in ytms]
-    derivatives_decimal = _compute_first_derivative(ytms_decimal, prices)
-    derivatives_percent = [
-        math.nan if math.isnan(val) else val / 100 for val in derivatives_decimal
-    ]
-    cleaned_curve["price_derivative"] = derivatives_percent
-    return cleaned_curve[["ytm", "price_derivative"]]
+_CURVE_METRICS = ("price_derivative", "modified_duration", "convexity")
 
 
-def calculate_modified_duration_curve(curve):
-    pd = _ensure_pandas()
-    cleaned_curve = _prepare_clean_curve(curve, ["ytm", "modified_duration"])
+def curve_metrics_arrays(ytms, prices, metrics=_CURVE_METRICS) -> Dict[str, np.ndarray]:
+    # Derivative, duration and convexity all hang off the same dP/dy, so take
+    # the gradient once and derive the requested columns from it; only
+    # convexity needs the second gradient.
+    if len(ytms) < 2:
+        return {column: np.empty(0) for column in ("ytm", *metrics)}
+    ytms_decimal = ytms / 100
+    first_derivative = _compute_first_derivative(ytms_decimal, prices)
+    result = {"ytm": ytms}
+    if "price_derivative" in metrics:
+        result["price_derivative"] = first_derivative / 100
+    if "modified_duration" in metrics:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            durations = -(first_derivative / prices)
+        result["modified_duration"] = np.where(np.isfinite(durations), durations, np.nan)
+    if "convexity" in metrics:
+        result["convexity"] = _compute_first_derivative(ytms_decimal, first_derivative)
+    return result
+
+
+def _select_curve_metric(curve, column):
+    cleaned_curve = _prepare_clean_curve(curve, ["ytm", column])
     if cleaned_curve.empty:
         return cleaned_curve
 
-    ytms_decimal = [ytm / 100 for ytm in cleaned_curve["ytm"].tolist()]
-    prices = cleaned_curve["price"].tolist()
-    first_derivative = _compute_first_derivative(ytms_decimal, prices)
+    metrics = curve_metrics_arrays(
+        cleaned_curve["ytm"].to_numpy(dtype=np.float64),
+        cleaned_curve["price"].to_numpy(dtype=np.float64),
+        metrics=(column,),
+    )
+    cleaned_curve[column] = metrics[column]
+    return cleaned_curve[["ytm", column]]
 
-    durations = []
-    for price, d_price in zip(prices, first_derivative):
-        if price in (0, math.inf, -math.inf) or math.isnan(price) or math.isnan(d_price):
-            durations.append(math.nan)
-            continue
-        durations.append(-(d_price / price))
 
-    cleaned_curve["modified_duration"] = durations
-    return cleaned_curve[["ytm", "modified_duration"]]
+def calculate_price_yield_derivative(curve):
+    return _select_curve_metric(curve, "price_derivative")
+
+
+def calculate_modified_duration_curve(curve):
+    return _select_curve_metric(curve, "modified_duration")
 
 
 def calculate_convexity_curve(curve):
-    pd = _ensure_pandas()
-    cleaned_curve = _prepare_clean_curve(curve, ["ytm", "convexity"])
-    if cleaned_curve.empty:
-        return cleaned_curve
+    return _select_curve_metric(curve, "convexity")
 
-    ytms_decimal = [ytm / 100 for ytm in cleaned_curve["ytm"].tolist()]
-    prices = cleaned_curve["price"].tolist()
 
-    first_derivative = _compute_first_derivative(ytms_decimal, prices)
-    second_derivative = _compute_first_derivative(ytms_decimal, first_derivative)
+def generate_price_yield_curve_arrays(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100):
+    prices, ytms = _calculate_ytm_range_arrays(
+        par_value,
+        coupon_rate,
+        periods,
+        coupon_frequency,
+        min_price,
+        max_price,
+        num_points,
+    )
+    if prices is None or ytms is None:
+        return np.empty(0), np.empty(0)
+    return _clean_curve_arrays(ytms, prices)
 
-    cleaned_curve["convexity"] = [
-        math.nan if math.isnan(val) else val for val in second_derivative
-    ]
-    return cleaned_curve[["ytm", "convexity"]]
+
+def _curve_frame(ytms, prices):
+    pd = _ensure_pandas()
+    return pd.DataFrame({"ytm": ytms, "price": prices})
 
 
 def generate_price_yield_curve(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100):
-    prices, ytms = calculate_ytm_range(
+    ytms, prices = generate_price_yield_curve_arrays(
         par_value,
         coupon_rate,
         periods,
@@ -131,17 +197,69 @@ def generate_price_yield_curve(par_value, coupon_rate, periods, coupon_frequency
         max_price,
         num_points,
     )
+    return _curve_frame(ytms, prices)
+
+
+def price_yield_points(par_value, coupon_rate, periods, coupon_frequency, ytms) -> np.ndarray:
+    # Price the bond at each yield (in percent) in one vectorized pass.
+    ytms = np.asarray(ytms, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return _bond_price_vec(float(par_value), float(coupon_rate), periods, ytms / 100, coupon_frequency)
+
+
+def generate_yield_price_curve_arrays(par_value, coupon_rate, periods, coupon_frequency, min_ytm, max_ytm, num_points=100):
+    # Match the price-grid path, which yields an empty curve for a
+    # non-positive point count instead of raising.
+    if num_points < 1:
+        return np.empty(0), np.empty(0)
+    ytms = np.linspace(min_ytm, max_ytm, num_points)
+    prices = price_yield_points(par_value, coupon_rate, periods, coupon_frequency, ytms)
+    return _clean_curve_arrays(ytms, prices)
+
+
+def generate_yield_price_curve(par_value, coupon_rate, periods, coupon_frequency, min_ytm, max_ytm, num_points=100):
+    ytms, prices = generate_yield_price_curve_arrays(
+        par_value,
+        coupon_rate,
+        periods,
+        coupon_frequency,
+        min_ytm,
+        max_ytm,
+        num_points,
+    )
+    return _curve_frame(ytms, prices)
+
+
+def compute_all_curves(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100):
     pd = _ensure_pandas()
-    if prices is None or ytms is None:
-        return pd.DataFrame(columns=["ytm", "price"])
-    return (
-        pd.DataFrame({"ytm": ytms, "price": prices})
-        .replace([math.inf, -math.inf], math.nan)
-        .dropna()
-        .sort_values("ytm")
-        .drop_duplicates(subset="ytm")
-        .reset_index(drop=True)
+    ytms, prices = generate_price_yield_curve_arrays(
+        par_value,
+        coupon_rate,
+        periods,
+        coupon_frequency,
+        min_price,
+        max_price,
+        num_points,
     )
+    columns = ["ytm", "price", "price_derivative", "modified_duration", "convexity"]
+    if len(ytms) < 2:
+        return pd.DataFrame(columns=columns)
+
+    return pd.DataFrame({"price": prices, **curve_metrics_arrays(ytms, prices)}, columns=columns)
+
+
+def get_reusable_ax(label="bondcalc"):
+    plt = _ensure_matplotlib()
+
+    # Reuse one named figure across calls and clear its axes, rather than
+    # paying for a fresh figure (and leaking it into pyplot) every time.
+    # Opt-in for batch callers: pass the result as ax= to the plot helpers.
+    fig = plt.figure(num=label, figsize=(10, 6))
+    if fig.axes:
+        ax = fig.axes[0]
+        ax.cla()
+        return ax
+    return fig.add_subplot()
 
 
 def plot_price_yield_curve(par_value, coupon_rate, periods, coupon_frequency, min_price, max_price, num_points=100, show=True, ax=None):
@@ -149,10 +267,7 @@ def plot_price_yield_curve(par_value, coupon_rate, periods, coupon_frequency, mi
     if curve.empty:
         return curve
 
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError as exc:
-        raise RuntimeError("matplotlib is required for plotting") from exc
+    plt = _ensure_matplotlib()
 
     if ax is None:
         _, ax = plt.subplots(figsize=(10, 6))
@@ -173,10 +288,7 @@ def plot_price_yield_derivative(par_value, coupon_rate, periods, coupon_frequenc
     if derivative.empty:
         return derivative
 
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError as exc:
-        raise RuntimeError("matplotlib is required for plotting") from exc
+    plt = _ensure_matplotlib()
 
     if ax is None:
         _, ax = plt.subplots(figsize=(10, 6))
@@ -1,70 +1,106 @@
 from __future__ import annotations
 
 import math
+from typing import Callable, Optional, Tuple
 
+from ._kernels import _bond_price_kernel, _ytm_newton_kernel
 
-def _is_invalid(*values):
-    for value in values:
-        if value is None:
-            return True
-        try:
-            if math.isnan(float(value)):
-                return True
-        except (TypeError, ValueError):
-            continue
-    return False
+try:
+    from scipy.optimize import brentq
+except ImportError:
+    brentq = None
 
 
-def bond_price(par_value: float, coupon_rate: float, periods: int, ytm: float, coupon_frequency: int = 2):
-    if _is_invalid(par_value, coupon_rate, periods, ytm) or periods <= 0:
-        return math.nan
+def bond_price(par_value: float, coupon_rate: float, periods: int, ytm: float, coupon_frequency: int = 2) -> float:
     try:
         par_value = float(par_value)
         coupon_rate = float(coupon_rate)
         ytm = float(ytm)
-        coupon = (coupon_rate / 100) * par_value / coupon_frequency
-
-        # Handle the zero-yield edge case to avoid dividing by zero while
-        # preserving the limit price where discounting disappears.
-        if abs(ytm) < 1e-12:
-            return coupon * periods + par_value
-
-        discount_factor = 1 / (1 + ytm / coupon_frequency)
-        coupon_pv = coupon * (1 - discount_factor ** periods) / (ytm / coupon_frequency)
-        par_pv = par_value * discount_factor ** periods
-        return coupon_pv + par_pv
+        if math.isnan(par_value) or math.isnan(coupon_rate) or math.isnan(ytm) or math.isnan(periods) or periods <= 0:
+            return math.nan
+        return _bond_price_kernel(par_value, coupon_rate, periods, ytm, coupon_frequency)
     except (ValueError, TypeError):
         return math.nan
 
 
-def _newton(func, guess: float, maxiter: int = 150, tol: float = 1e-8):
-    x = guess
+def _approximate_ytm(price: float, par_value: float, coupon_rate: float, periods: int, coupon_frequency: int = 2) -> float:
+    years = periods / coupon_frequency
+    annual_coupon = (coupon_rate / 100) * par_value
+    return (annual_coupon + (par_value - price) / years) / ((par_value + price) / 2)
+
+
+def _bisect(func: Callable[[float], float], lower: float, upper: float, maxiter: int = 200, tol: float = 1e-12) -> float:
+    f_lower = func(lower)
+    f_upper = func(upper)
+    if math.isnan(f_lower) or math.isnan(f_upper) or f_lower * f_upper > 0:
+        raise RuntimeError("Root is not bracketed")
+    for _ in range(maxiter):
+        midpoint = (lower + upper) / 2
+        f_mid = func(midpoint)
+        if f_mid == 0 or (upper - lower) / 2 < tol:
+            return midpoint
+        if (f_mid > 0) == (f_lower > 0):
+            lower, f_lower = midpoint, f_mid
+        else:
+            upper = midpoint
+    return (lower + upper) / 2
+
+
+def _bracket_ytm(func: Callable[[float], float], coupon_frequency: int, maxiter: int = 60) -> Tuple[float, float]:
+    # Price falls monotonically as the yield rises, so the error is positive
+    # below the root and negative above it. Widen each side until it flips.
+    lower, upper = 0.0, 0.1
     for _ in range(maxiter):
-        fx = func(x)
-        h = 1e-5
-        derivative = (func(x + h) - fx) / h
-        if derivative == 0:
+        if func(lower) >= 0:
             break
-        step = fx / derivative
-        x -= step
-        if abs(step) < tol:
-            return x
-    raise RuntimeError("Newton method did not converge")
+        lower = (lower - coupon_frequency) / 2
+    for _ in range(maxiter):
+        if func(upper) <= 0:
+            break
+        upper *= 2
+    return lower, upper
 
 
-def calculate_ytm(price: float, par_value: float, coupon_rate: float, periods: int, coupon_frequency: int = 2):
-    if _is_invalid(price, par_value, coupon_rate, periods) or periods <= 0:
+def calculate_ytm(
+    price: float,
+    par_value: float,
+    coupon_rate: float,
+    periods: int,
+    coupon_frequency: int = 2,
+    guess: Optional[float] = None,
+) -> float:
+    try:
+        price = float(price)
+        par_value = float(par_value)
+        coupon_rate = float(coupon_rate)
+        if math.isnan(price) or math.isnan(par_value) or math.isnan(coupon_rate) or math.isnan(periods) or periods <= 0:
+            return math.nan
+    except (ValueError, TypeError):
         return math.nan
 
-    price = float(price)
-    par_value = float(par_value)
-    coupon_rate = float(coupon_rate)
+    try:
+        # guess is a decimal yield (0.05 for 5%), typically a nearby solved
+        # root; without a usable one, start from the textbook approximation.
+        if guess is None or not math.isfinite(guess):
+            guess = _approximate_ytm(price, par_value, coupon_rate, periods, coupon_frequency)
+        ytm = _ytm_newton_kernel(price, par_value, coupon_rate, periods, coupon_frequency, guess, 8, 1e-10)
+    except OverflowError:
+        ytm = math.nan
+    if not math.isnan(ytm):
+        return ytm * 100
 
-    def bond_price_error(ytm_guess: float):
-        return bond_price(par_value, coupon_rate, periods, ytm_guess, coupon_frequency) - price
+    def bond_price_error(ytm_guess: float) -> float:
+        return _bond_price_kernel(par_value, coupon_rate, periods, ytm_guess, coupon_frequency) - price
 
+    # Newton rarely fails on the convex, monotone price curve; when it does,
+    # fall back to a bracketed solve around the root (Brent's method when
+    # scipy is available, bisection otherwise).
     try:
-        ytm = _newton(bond_price_error, 0.05, maxiter=150)
+        lower, upper = _bracket_ytm(bond_price_error, coupon_frequency)
+        if brentq is not None:
+            ytm = brentq(bond_price_error, lower, upper, xtol=1e-12, maxiter=200)
+        else:
+            ytm = _bisect(bond_price_error, lower, upper)
         return ytm * 100
-    except (ValueError, TypeError, RuntimeError):
+    except (ValueError, TypeError, ZeroDivisionError, OverflowError, RuntimeError):
         return math.nan
@@ -0,0 +1,73 @@
+import json
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("flask")
+
+from app import _generate_yield_targets, app
+
+
+def _analyze(**overrides):
+    payload = {
+        "par_value": 1000,
+        "coupon_rate": 2.45,
+        "coupon_frequency": 2,
+        "issue_date": "01/03/2020",
+        "maturity_date": "01/03/2050",
+        "purchase_date": "15/06/2023",
+        "price": 850,
+        "min_price": 700,
+        "max_price": 1100,
+        "num_points": 20,
+    }
+    payload.update(overrides)
+    return app.test_client().post("/api/analyze", json=payload)
+
+
+def test_generate_yield_targets_brackets_fractional_yield():
+    assert _generate_yield_targets(4.3) == [0, 1, 2, 3, 4, 5, 6, 7]
+    assert _generate_yield_targets(10.6) == [0, 7, 8, 9, 10, 11, 12, 13]
+
+
+def test_generate_yield_targets_skips_integer_yield():
+    assert _generate_yield_targets(5.0) == [0, 1, 2, 3, 4, 6, 7, 8]
+    assert _generate_yield_targets(-2.5) == [0, 1, 2, 3, 4, 5, 6, 7]
+    assert _generate_yield_targets(float("nan")) == []
+
+
+def test_generate_yield_targets_without_points_is_empty():
+    assert _generate_yield_targets(4.3, max_points=0) == []
+    assert _generate_yield_targets(4.3, max_points=-1) == []
+
+
+@pytest.mark.parametrize("value", ["1/3/50", "01/03/50", " 01/03/2050 ", "+1/3/2050"])
+def test_analyze_rejects_short_year_and_padded_dates(value):
+    response = _analyze(maturity_date=value)
+
+    assert response.status_code == 400
+
+
+def test_analyze_returns_empty_curve_for_non_positive_num_points():
+    response = _analyze(num_points=-5)
+
+    assert response.status_code == 200
+    assert response.get_json()["curve"] == {"ytm": [], "price": []}
+
+
+def test_analyze_serializes_nan_as_null():
+    response = _analyze(price=-50)
+
+    def reject_constant(token):
+        raise ValueError(f"non-standard JSON token {token}")
+
+    body = json.loads(response.get_data(as_text=True), parse_constant=reject_constant)
+    assert response.status_code == 200
+    assert body["summary"]["ytm"] is None
+
+
+def test_json_provider_maps_non_finite_numpy_values_to_null():
+    payload = {"lane": np.array([1.5, np.nan, np.inf]), "scalar": np.float64(-np.inf), "plain": math.nan}
+
+    assert json.loads(app.json.dumps(payload)) == {"lane": [1.5, None, None], "scalar": None, "plain": None}
@@ -1,6 +1,10 @@
 from pathlib import Path
 import json
+from datetime import date
 
+import pytest
+
+from bondcalc.analytics import parse_ddmmyyyy
 from bondcalc.cli import analyze_bond, build_parser, load_bonds, _parse_date
 from bondcalc.models import AnalysisRequest
 
@@ -45,3 +49,10 @@ def test_analyze_bond_flow(tmp_path):
     assert result is not None
     assert result.ytm > 0
     assert result.modified_duration > 0
+
+
+def test_parse_ddmmyyyy_requires_four_digit_year():
+    assert parse_ddmmyyyy("1/3/2020") == date(2020, 3, 1)
+    for value in ("1/1/20", "15/06/24", " 01/03/2020 ", "+1/3/2020", "01/03/2020/1", "31/02/2020"):
+        with pytest.raises(ValueError):
+            parse_ddmmyyyy(value)
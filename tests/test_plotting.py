@@ -12,11 +12,39 @@ from bondcalc.plotting import (
     calculate_convexity_curve,
     calculate_modified_duration_curve,
     calculate_price_yield_derivative,
+    calculate_ytm_range,
+    compute_all_curves,
     generate_price_yield_curve,
+    generate_yield_price_curve,
+    get_reusable_ax,
+    plot_price_yield_curve,
     plot_price_yield_derivative,
+    price_yield_points,
 )
+from bondcalc.pricing import bond_price, calculate_ytm
 
 
+def test_calculate_ytm_range_matches_scalar_solver():
+    prices, ytms = calculate_ytm_range(1000, 2.45, 182, 2, 700, 1100, 25)
+
+    assert len(prices) == len(ytms) == 25
+    for price, ytm in zip(prices, ytms):
+        expected = calculate_ytm(price, 1000, 2.45, 182, 2)
+        assert math.isclose(ytm, expected, rel_tol=1e-8)
+
+
+
+@pytest.mark.parametrize("periods", [-10, 0, math.nan])
+def test_calculate_ytm_range_rejects_invalid_periods(periods):
+    prices, ytms = calculate_ytm_range(100, 5.0, periods, 2, 90, 110, 5)
+
+    assert prices == pytest.approx([90, 95, 100, 105, 110])
+    assert all(math.isnan(ytm) for ytm in ytms)
+
+
+def test_calculate_ytm_range_without_points_is_empty():
+    assert calculate_ytm_range(100, 5.0, 10, 2, 90, 110, -3) == ([], [])
+
 def test_calculate_price_yield_derivative():
     curve = generate_price_yield_curve(100, 5.0, 10, 1, 90, 110, 8)
     derivative = calculate_price_yield_derivative(curve)
@@ -60,3 +88,62 @@ def test_convexity_curve_is_monotonic_with_ytm():
     assert not convexity.empty
     assert convexity["ytm"].is_monotonic_increasing
     assert convexity.shape[0] == curve.drop_duplicates(subset="ytm").shape[0]
+
+
+def test_generate_yield_price_curve_prices_a_uniform_yield_grid():
+    curve = generate_yield_price_curve(100, 5.0, 10, 2, 2.0, 8.0, 7)
+
+    assert curve["ytm"].tolist() == pytest.approx([2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0])
+    for ytm, price in zip(curve["ytm"], curve["price"]):
+        assert math.isclose(price, bond_price(100, 5.0, 10, ytm / 100, 2), rel_tol=1e-12)
+
+
+def test_compute_all_curves_matches_individual_curves():
+    args = (100, 5.0, 10, 2, 90, 110, 12)
+    combined = compute_all_curves(*args)
+    curve = generate_price_yield_curve(*args)
+
+    assert list(combined.columns) == ["ytm", "price", "price_derivative", "modified_duration", "convexity"]
+    assert combined["ytm"].tolist() == curve["ytm"].tolist()
+    assert combined["price_derivative"].tolist() == pytest.approx(
+        calculate_price_yield_derivative(curve)["price_derivative"].tolist(), rel=1e-12
+    )
+    assert combined["modified_duration"].tolist() == pytest.approx(
+        calculate_modified_duration_curve(curve)["modified_duration"].tolist(), rel=1e-12
+    )
+    assert combined["convexity"].tolist() == pytest.approx(
+        calculate_convexity_curve(curve)["convexity"].tolist(), rel=1e-12
+    )
+
+
+def test_get_reusable_ax_reuses_and_clears_one_figure():
+    pytest.importorskip("matplotlib")
+
+    first = get_reusable_ax("test-reuse")
+    first.plot([0, 1], [0, 1])
+    second = get_reusable_ax("test-reuse")
+
+    assert second is first
+    assert second.figure is first.figure
+    assert not second.lines
+
+
+def test_headless_plots_get_separate_figures():
+    plt = pytest.importorskip("matplotlib.pyplot")
+    plt.close("all")
+
+    plot_price_yield_curve(100, 4.5, 12, 2, 95, 105, 6, show=False)
+    plot_price_yield_derivative(100, 4.5, 12, 2, 95, 105, 6, show=False)
+
+    figures = [plt.figure(num) for num in plt.get_fignums()]
+    labels = sorted(line.get_label() for fig in figures for line in fig.axes[0].lines)
+    plt.close("all")
+    assert len(figures) == 2
+    assert labels == ["Price-Yield Curve", "dPrice/dYTM"]
+
+
+def test_price_yield_points_prices_each_percent_yield():
+    prices = price_yield_points(100, 5.0, 10, 2, [0.0, 3.5, 12.0])
+
+    for ytm, price in zip([0.0, 3.5, 12.0], prices):
+        assert math.isclose(price, bond_price(100, 5.0, 10, ytm / 100, 2), rel_tol=1e-12)
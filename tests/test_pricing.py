@@ -2,7 +2,8 @@ import math
 from datetime import date
 
 import bondcalc
-from bondcalc.analytics import calculate_modified_duration
+from bondcalc.analytics import calculate_accrued_interest, calculate_accrued_interest_batch, calculate_modified_duration
+from bondcalc._kernels import _bond_price_and_derivative_kernel
 
 
 def test_bond_price_matches_expected():
@@ -19,3 +20,61 @@ def test_calculate_ytm_solves_price():
 def test_modified_duration():
     duration = calculate_modified_duration(100, 5.0, 5, 0.04, coupon_frequency=1)
     assert math.isclose(duration, 4.381814, rel_tol=1e-6)
+
+
+def test_calculate_ytm_round_trips_deep_discount_long_bond():
+    ytm = bondcalc.calculate_ytm(60, 1000, 2.1, 1100, coupon_frequency=12)
+    assert math.isclose(bondcalc.bond_price(1000, 2.1, 1100, ytm / 100, coupon_frequency=12), 60, rel_tol=1e-9)
+
+
+def test_bond_price_derivative_matches_finite_difference():
+    h = 1e-5
+    for ytm in (0.0, 0.035, 0.12):
+        numeric = (bondcalc.bond_price(100, 5.0, 20, ytm + h, 2) - bondcalc.bond_price(100, 5.0, 20, ytm - h, 2)) / (2 * h)
+        price, derivative = _bond_price_and_derivative_kernel(100, 5.0, 20, ytm, 2)
+        assert math.isclose(price, bondcalc.bond_price(100, 5.0, 20, ytm, 2), rel_tol=1e-12)
+        assert math.isclose(derivative, numeric, rel_tol=1e-6)
+
+
+def test_accrued_interest_batch_matches_scalar():
+    issue_dates = [date(2020, 1, 15), date(2018, 6, 30), date(2021, 11, 1)]
+    purchase_dates = [date(2023, 3, 10), date(2024, 2, 29), date(2021, 12, 31)]
+    frequencies = [1, 2, 4]
+
+    accrued = calculate_accrued_interest_batch([100, 1000, 100], [5.0, 2.45, 7.0], issue_dates, purchase_dates, frequencies)
+
+    for value, par, rate, issue, purchase, frequency in zip(
+        accrued, [100, 1000, 100], [5.0, 2.45, 7.0], issue_dates, purchase_dates, frequencies
+    ):
+        expected = calculate_accrued_interest(
+            par, rate, issue.strftime("%d/%m/%Y"), purchase.strftime("%d/%m/%Y"), frequency
+        )
+        assert value == expected
+
+
+def test_calculate_ytm_accepts_warm_start_guess():
+    cold = bondcalc.calculate_ytm(87.5, 100, 4.0, 30, coupon_frequency=2)
+    for guess in (cold / 100 + 0.002, 0.5, math.nan):
+        warm = bondcalc.calculate_ytm(87.5, 100, 4.0, 30, coupon_frequency=2, guess=guess)
+        assert math.isclose(warm, cold, rel_tol=1e-9)
+
+
+def test_accrued_interest_purchase_before_issue_keeps_issue_as_last_coupon():
+    accrued = calculate_accrued_interest(1000, 2.45, "01/03/2024", "15/06/2023", 2)
+    # 260 days before issue, wrapped by one half-year coupon interval.
+    assert math.isclose(accrued, 24.5 * (182.625 - 260) / 182.625, rel_tol=1e-12)
+
+
+def test_accrued_interest_batch_accepts_scalar_inputs_and_flags_bad_lanes():
+    accrued = calculate_accrued_interest_batch(
+        1000,
+        2.45,
+        ["01/03/2024", "01/03/2024", "2024-03-01", "01/03/2024"],
+        "15/06/2023",
+        [2, 2, 2, "semiannual"],
+    )
+
+    assert accrued[0] == calculate_accrued_interest(1000, 2.45, "01/03/2024", "15/06/2023", 2)
+    assert accrued[1] == accrued[0]
+    assert math.isnan(accrued[2])
+    assert math.isnan(accrued[3])